@@ -0,0 +1,97 @@
+"""Hatch build hook that precompiles template assets shipped in the wheel.
+
+- Each ``.j2`` template that needs Jinja at runtime (i.e. is not handled by the
+  substitution-only fast path) is compiled to Jinja's generated Python source
+  and written to ``_templates_compiled.py``, so the CLI can skip lexing and
+  parsing templates at runtime. Python source (rather than marshalled code
+  objects) is stored so the wheel stays valid across interpreter versions, and
+  it is tagged with the Jinja version that generated it, since the runtime
+  only uses it under that same version.
+- The static files of each (template, routing) pair are packed into
+  ``templates/_bundles/<template>-<routing>.tar`` in their final layout, so a
+  project's static pages are written from one archive instead of one template
+  file each.
+"""
+
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+PACKAGE_DIR = Path(__file__).parent / "src" / "create_pywire_app"
+
+
+class TemplateCompileHook(BuildHookInterface):
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        # Editable installs read templates straight from the source tree
+        if self.target_name != "wheel" or version == "editable":
+            return
+
+        sys.path.insert(0, str(PACKAGE_DIR.parent))
+        try:
+            from create_pywire_app.main import (
+                MANIFESTS,
+                TEMPLATE_ROOT,
+                _build_env,
+                _get_simple_template,
+            )
+        finally:
+            sys.path.pop(0)
+
+        self._output_dir = tempfile.TemporaryDirectory()
+        output = Path(self._output_dir.name)
+
+        compiled = output / "_templates_compiled.py"
+        compiled.write_text(
+            self._compile_templates(TEMPLATE_ROOT, _build_env(), _get_simple_template)
+        )
+        build_data["force_include"][str(compiled)] = (
+            "create_pywire_app/_templates_compiled.py"
+        )
+
+        for (template, routing), manifest in MANIFESTS.items():
+            bundle = output / f"{template}-{routing}.tar"
+            static = [(src, dest) for kind, src, dest in manifest if kind == "copy"]
+            if not static:
+                continue
+            self._write_bundle(bundle, TEMPLATE_ROOT, static)
+            build_data["force_include"][str(bundle)] = (
+                f"create_pywire_app/templates/_bundles/{bundle.name}"
+            )
+
+    def finalize(self, version, build_data, artifact_path):
+        output_dir = getattr(self, "_output_dir", None)
+        if output_dir is not None:
+            output_dir.cleanup()
+
+    @staticmethod
+    def _compile_templates(template_root, env, get_simple_template):
+        import jinja2
+
+        lines = [
+            "# Generated by hatch_build.py; do not edit.",
+            f"JINJA_VERSION = {jinja2.__version__!r}",
+            "TEMPLATES = {",
+        ]
+        for path in sorted(template_root.rglob("*.j2")):
+            name = path.relative_to(template_root).as_posix()
+            # Fast-path templates never load compiled code
+            if get_simple_template(name) is not None:
+                continue
+            source = path.read_text(encoding="utf-8")
+            code = env.compile(source, name, name, raw=True)
+            lines.append(f"    {name!r}: {code!r},")
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _write_bundle(bundle, template_root, files):
+        with tarfile.open(bundle, "w") as archive:
+            for source, dest in files:
+                info = archive.gettarinfo(template_root / source, arcname=dest)
+                with open(template_root / source, "rb") as f:
+                    archive.addfile(info, f)
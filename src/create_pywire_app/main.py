@@ -1,21 +1,48 @@
 import argparse
+import contextlib
+import functools
 import os
+import re
+import shutil
 import subprocess
 import sys
-import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
 
-import questionary
 import tomllib
-from jinja2 import Environment, PackageLoader, select_autoescape
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
 
 from create_pywire_app import __version__
 
-console = Console()
+# questionary, jinja2, rich, tomli_w, urllib, tarfile and concurrent.futures
+# are imported lazily so that `--help` and `--version` don't pay for loading them
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from jinja2 import Environment, FileSystemBytecodeCache, Template
+    from rich.console import Console
+    from rich.text import Text
+
+PYPI_JSON_URL = "https://pypi.org/pypi/pywire/json"
+GIT_COMMIT_MESSAGE = "feat: initial project structure"
+TEMPLATE_ROOT = Path(__file__).parent / "templates"
+
+_PYWIRE_VER_RE = re.compile(r"pywire==(\S+)")
+_VERSION_ASSIGN_RE = re.compile(r'version\s*=\s*["\']([^"\']+)["\']')
+_SIMPLE_VAR_RE = re.compile(r"{{\s*([A-Za-z_]\w*)\s*}}")
+_PROJECT_VERSION_RE = re.compile(
+    r'\[project\][^\[]*?\nversion\s*=\s*["\']([^"\']+)["\']', re.S
+)
 
 LOGO = r"""
  [bold cyan]
@@ -33,6 +60,11 @@ def get_local_version(path: Path) -> Optional[str]:
     """Try to read version from a local pyproject.toml file."""
     try:
         if path.exists():
+            # Scan the [project] table directly; only parse the whole file
+            # if the version isn't where we expect it
+            match = _PROJECT_VERSION_RE.search(path.read_text())
+            if match:
+                return match.group(1)
             with open(path, "rb") as f:
                 data = tomllib.load(f)
                 return data.get("project", {}).get("version")
@@ -54,59 +86,384 @@ def resolve_pywire_version(pywire_dep: str) -> Optional[str]:
     Returns:
         Resolved version string or None if resolution fails
     """
-    # For local paths, we can't resolve via uv pip compile
+    # For local paths, there is no published version to look up
     if "@" in pywire_dep:
         return None
 
+    # Pinned versions are already known, no need to hit the index
+    match = _PYWIRE_VER_RE.search(pywire_dep)
+    if match:
+        return match.group(1)
+
+    import http.client
+    import json
+    import urllib.request
+
     try:
-        # Use uv pip compile to resolve the version without installing
-        process = subprocess.run(
-            ["uv", "pip", "compile", "-", "--quiet"],
-            input=pywire_dep,
-            text=True,
-            capture_output=True,
-            check=True,
-            timeout=10,
+        # Ask the PyPI JSON API for the latest release
+        request = urllib.request.Request(
+            PYPI_JSON_URL, headers={"Accept": "application/json"}
         )
+        with urllib.request.urlopen(request, timeout=2) as response:
+            return json.load(response)["info"]["version"]
+    except (OSError, http.client.HTTPException, ValueError, KeyError):
+        # Network and protocol errors (not all of which urlopen wraps in
+        # URLError) only cost us the display string
+        pass
 
-        # Parse the output for pywire==<version>
-        import re
+    return None
 
-        match = re.search(r"pywire==([^\s]+)", process.stdout)
-        if match:
-            return match.group(1)
 
-    except (
-        subprocess.CalledProcessError,
-        subprocess.TimeoutExpired,
-        FileNotFoundError,
-    ):
+def _make_bytecode_cache() -> Optional["FileSystemBytecodeCache"]:
+    """Create the on-disk bytecode cache, or None if the cache dir is unusable.
+
+    The cache lives in the per-user cache directory rather than the shared temp
+    dir, so other users on the machine cannot plant compiled templates in it.
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    try:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(cache_home) / "create-pywire-app" / "jinja"
+        cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+    except (OSError, RuntimeError):
+        return None
+    # An existing directory may still be unwritable (e.g. left by a sudo run),
+    # and Jinja would then fail while storing compiled templates
+    if not os.access(cache_dir, os.W_OK):
+        return None
+    return FileSystemBytecodeCache(directory=str(cache_dir))
+
+
+def _build_env(
+    bytecode_cache: Optional["FileSystemBytecodeCache"] = None,
+) -> "Environment":
+    """Create a Jinja2 environment configured for the project templates."""
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_ROOT),
+        # Scaffolding output is never untrusted HTML, and select_autoescape()
+        # never matched the .j2 names anyway
+        autoescape=False,
+        # Templates ship with the package and don't change while we run
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # The template set is small and fixed, so never evict compiled ones
+        cache_size=-1,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_env() -> "Environment":
+    """Build the shared Jinja2 environment on first use.
+
+    Shared across renderers so templates are only loaded and compiled once per
+    process; the bytecode cache lets later invocations skip compilation too.
+    """
+    return _build_env(bytecode_cache=_make_bytecode_cache())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_compiled_templates() -> Dict[str, str]:
+    """Templates precompiled by the build hook, or {} when running from source.
+
+    The generated code is only valid for the Jinja2 release that produced it,
+    so it is ignored when a different one is installed.
+    """
+    try:
+        from create_pywire_app import _templates_compiled  # type: ignore
+    except ImportError:
+        return {}
+    from jinja2 import __version__ as jinja_version
+
+    if getattr(_templates_compiled, "JINJA_VERSION", None) != jinja_version:
+        return {}
+    return _templates_compiled.TEMPLATES
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template(template_path: str) -> "Template":
+    """Load a template from the shared environment, memoized by path.
+
+    Templates precompiled at build time are used directly, skipping Jinja's
+    lexer and parser; anything else goes through the loader.
+    """
+    env = _get_env()
+    source = _get_compiled_templates().get(template_path)
+    if source is not None:
+        code = compile(source, template_path, "exec")
+        return env.template_class.from_code(env, code, env.make_globals(None))
+    return env.get_template(template_path)
+
+
+class _Context(dict):
+    """Template context where missing names render empty, as in Jinja2."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_simple_template(
+    template_path: str,
+) -> Optional[Callable[[Dict[str, Any]], str]]:
+    """Build a fast renderer for a substitution-only template.
+
+    Templates without any Jinja2 syntax render to their stored text as is;
+    templates with plain ``{{ name }}`` substitutions are filled in with
+    str.format_map. Returns None for templates using anything else (tags,
+    comments, filters, ...), which go through Jinja2.
+    """
+    # Decode as UTF-8 like Jinja2's FileSystemLoader, whatever the locale
+    source = (TEMPLATE_ROOT / template_path).read_text(encoding="utf-8")
+    if "{%" in source or "{#" in source or "\r" in source:
+        return None
+
+    parts = _SIMPLE_VAR_RE.split(source)
+    literals, names = parts[::2], parts[1::2]
+    if any("{{" in literal for literal in literals):
+        return None
+
+    # Jinja2 drops a single trailing newline by default
+    if literals[-1].endswith("\n"):
+        literals[-1] = literals[-1][:-1]
+
+    if not names:
+        text = literals[0]
+        return lambda context: text
+
+    escaped = [literal.replace("{", "{{").replace("}", "}}") for literal in literals]
+    fields = [f"{{{name}}}" for name in names] + [""]
+    fmt = "".join(literal + field for literal, field in zip(escaped, fields))
+    return lambda context: fmt.format_map(_Context(context))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_logo() -> "Text":
+    """Parse the LOGO markup once into a renderable."""
+    from rich.text import Text
+
+    return Text.from_markup(LOGO)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_console() -> "Console":
+    """Create the shared rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _status(message: str, **kwargs: Any) -> ContextManager[Any]:
+    """Show a spinner while the block runs, or nothing when not on a terminal.
+
+    Skipping rich's live display off-terminal avoids starting its refresh
+    thread in CI and piped runs, where the animation is disabled anyway.
+    """
+    console = _get_console()
+    if not console.is_terminal:
+        return contextlib.nullcontext()
+    return console.status(message, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def find_uv_bin() -> str:
+    """Locate the uv executable once, preferring the `uv` Python package."""
+    try:
+        from uv import find_uv_bin as find_packaged_uv_bin  # type: ignore
+
+        return find_packaged_uv_bin()
+    except (ImportError, FileNotFoundError):
         pass
+    # Fall back to the bare name so a missing uv surfaces as FileNotFoundError
+    return shutil.which("uv") or "uv"
 
-    return None
+
+def git_init_commands() -> List[List[str]]:
+    """Commands that initialize a repo and commit the generated project.
+
+    On POSIX the steps are chained in a single shell so only one process is
+    spawned from Python; Windows runs them one by one.
+    """
+    if os.name == "nt":
+        return [
+            ["git", "init", "-q"],
+            ["git", "add", "."],
+            ["git", "commit", "-q", "-m", GIT_COMMIT_MESSAGE],
+        ]
+    script = 'git init -q && git add . && git commit -q -m "$1"'
+    return [["sh", "-c", script, "sh", GIT_COMMIT_MESSAGE]]
+
+
+def write_file(path: Path, data: bytes) -> None:
+    """Write data to path using one open, as few writes as possible, one close.
+
+    Content is written as raw UTF-8 bytes, so generated files get the same
+    bytes (and LF line endings) on every platform.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+# Extra dependencies added to the generated project per template.
+_TEMPLATE_DEPS = MappingProxyType(
+    {
+        "blog": ("markdown>=3.6",),
+        "saas": ("stripe>=7.0.0", "sqlalchemy>=2.0.0"),
+    }
+)
+
+_TEMPLATE_DESC = MappingProxyType(
+    {
+        "skeleton": "A blank slate with only a single page.",
+        "counter": "A minimal counter app demonstrating interactivity.",
+        "blog": "A blog and portfolio starter with Markdown content stored in SQLite.",
+        "saas": "A SaaS starter with Stripe, SQLAlchemy models, and stubbed auth.",
+    }
+)
+
+# Deploy adapter name per adapter choice, in priority order when several
+# adapters are selected.
+_ADAPTER_DEPLOY = MappingProxyType(
+    {
+        "Docker (Dockerfile)": "docker",
+        "Render (render.yaml)": "render",
+    }
+)
+
+# A file to generate: its destination and a callable that writes it.
+FileJob = Tuple[Path, Callable[[], object]]
+
+ManifestEntry = Tuple[Literal["render", "copy"], str, str]
+
+# Template-specific files for each (template, routing) pair, as
+# (kind, template path, destination relative to the app root).
+MANIFESTS: Dict[Tuple[str, str], List[ManifestEntry]] = {
+    ("skeleton", "path"): [
+        ("render", "skeleton/index.wire.j2", "pages/index.wire"),
+    ],
+    ("skeleton", "explicit"): [
+        ("render", "skeleton/index.wire.j2", "pages/index.wire"),
+    ],
+    ("counter", "path"): [
+        ("render", "counter/path-based/__layout__.wire.j2", "pages/__layout__.wire"),
+        ("copy", "counter/path-based/index.wire", "pages/index.wire"),
+    ],
+    ("counter", "explicit"): [
+        ("render", "counter/explicit/layout.wire.j2", "pages/layout.wire"),
+        ("copy", "counter/explicit/home.wire", "pages/home.wire"),
+    ],
+    ("blog", "path"): [
+        ("render", "blog/path-based/__layout__.wire.j2", "pages/__layout__.wire"),
+        (
+            "render",
+            "blog/path-based/posts__layout__.wire.j2",
+            "pages/posts/__layout__.wire",
+        ),
+        ("copy", "blog/path-based/index.wire", "pages/index.wire"),
+        ("copy", "blog/path-based/posts_index.wire", "pages/posts/index.wire"),
+        ("copy", "blog/path-based/posts_slug.wire", "pages/posts/[slug].wire"),
+    ],
+    ("blog", "explicit"): [
+        ("render", "blog/explicit/layout.wire.j2", "pages/layout.wire"),
+        ("copy", "blog/explicit/home.wire", "pages/home.wire"),
+        ("copy", "blog/explicit/blog-posts.wire", "pages/blog-posts.wire"),
+        ("copy", "blog/explicit/about.wire", "pages/about.wire"),
+    ],
+    ("saas", "path"): [
+        ("copy", "saas/models.py", "models.py"),
+        ("render", "saas/path-based/__layout__.wire.j2", "pages/__layout__.wire"),
+        (
+            "render",
+            "saas/path-based/dashboard__layout__.wire.j2",
+            "pages/dashboard/__layout__.wire",
+        ),
+        ("copy", "saas/path-based/index.wire", "pages/index.wire"),
+        ("copy", "saas/path-based/pricing.wire", "pages/pricing.wire"),
+        ("copy", "saas/path-based/login.wire", "pages/login.wire"),
+        (
+            "copy",
+            "saas/path-based/dashboard_index.wire",
+            "pages/dashboard/index.wire",
+        ),
+        (
+            "copy",
+            "saas/path-based/dashboard_settings.wire",
+            "pages/dashboard/settings.wire",
+        ),
+    ],
+    ("saas", "explicit"): [
+        ("copy", "saas/models.py", "models.py"),
+        ("render", "saas/explicit/public-layout.wire.j2", "pages/public-layout.wire"),
+        ("render", "saas/explicit/auth-layout.wire.j2", "pages/auth-layout.wire"),
+        ("copy", "saas/explicit/landing.wire", "pages/landing.wire"),
+        ("copy", "saas/explicit/pricing.wire", "pages/pricing.wire"),
+        ("copy", "saas/explicit/login.wire", "pages/login.wire"),
+        (
+            "copy",
+            "saas/explicit/dashboard-pages.wire",
+            "pages/dashboard-pages.wire",
+        ),
+    ],
+}
 
 
 class TemplateRenderer:
     """Handles template loading and rendering using Jinja2."""
 
-    def __init__(self):
-        self.env = Environment(
-            loader=PackageLoader("create_pywire_app", "templates"),
-            autoescape=select_autoescape(),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
     def render(self, template_path: str, context: Dict[str, Any]) -> str:
-        """Render a template with the given context."""
-        template = self.env.get_template(template_path)
+        """Render a template with the given context.
+
+        Constant templates and templates that only substitute plain variables
+        bypass Jinja2's render machinery entirely.
+        """
+        simple = _get_simple_template(template_path)
+        if simple is not None:
+            return simple(context)
+        template = _get_template(template_path)
         return template.render(**context)
 
+    def preload(self, template_paths: List[str]) -> None:
+        """Load and compile templates ahead of rendering them."""
+        for template_path in template_paths:
+            if _get_simple_template(template_path) is None:
+                _get_template(template_path)
+
     def copy_static(self, source_path: str, dest: Path) -> None:
         """Copy a static template file (no Jinja2 rendering)."""
-        template_root = Path(__file__).parent / "templates"
-        source = template_root / source_path
-        dest.write_text(source.read_text())
+        shutil.copyfile(TEMPLATE_ROOT / source_path, dest)
+
+    def get_bundle(self, name: str) -> Optional[Path]:
+        """Return the prebuilt static-file bundle for name, if one is installed.
+
+        Bundles are only produced by the wheel build; source checkouts and
+        editable installs copy static files one by one instead.
+        """
+        bundle = TEMPLATE_ROOT / f"_bundles/{name}.tar"
+        return bundle if bundle.is_file() else None
+
+    def extract_bundle(self, bundle: Path, dest: Path) -> None:
+        """Write every file in a static-file bundle below dest.
+
+        The directories the files go into must already exist.
+        """
+        import tarfile
+
+        with tarfile.open(bundle) as archive:
+            for member in archive.getmembers():
+                source = archive.extractfile(member)
+                if source is None:
+                    continue
+                write_file(dest / member.name, source.read())
 
 
 class ProjectGenerator:
@@ -127,89 +484,143 @@ class ProjectGenerator:
         self.template = template
         self.routing_strategy = routing_strategy
         self.use_src = use_src
-        self.adapters = adapters
+        self.adapters = frozenset(adapters)
         self.pywire_dep = pywire_dep
         self.renderer = TemplateRenderer()
 
         self.app_root = project_path / "src" if use_src else project_path
         self.pages_dir = self.app_root / "pages"
+        self.bundle = self.renderer.get_bundle(f"{template}-{routing_strategy}")
 
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies for the selected template."""
-        dependencies = [self.pywire_dep]
+        # Compile everything up front so rendering is just template execution
+        self.renderer.preload(self.get_template_paths())
 
-        if self.template == "blog":
-            dependencies.append("markdown>=3.6")
-        if self.template == "saas":
-            dependencies.extend(["stripe>=7.0.0", "sqlalchemy>=2.0.0"])
+    def get_main_template(self) -> str:
+        """Get the main.py template for the selected routing strategy."""
+        if self.routing_strategy == "path":
+            return "common/main-path.py.j2"
+        return "common/main-explicit.py.j2"
+
+    def get_template_paths(self) -> List[str]:
+        """Get every Jinja2 template this project will render."""
+        template_paths = ["common/README.md.j2", self.get_main_template()]
+        if "Render (render.yaml)" in self.adapters:
+            template_paths.append("common/render.yaml.j2")
 
-        return dependencies
+        manifest = MANIFESTS.get((self.template, self.routing_strategy), [])
+        template_paths.extend(
+            source for kind, source, _ in manifest if kind == "render"
+        )
+        return template_paths
+
+    def get_dependencies(self) -> List[str]:
+        """Get dependencies for the selected template."""
+        return [self.pywire_dep, *_TEMPLATE_DEPS.get(self.template, ())]
 
     def get_template_description(self) -> str:
         """Get description for the selected template."""
-        descriptions = {
-            "skeleton": "A blank slate with only a single page.",
-            "counter": "A minimal counter app demonstrating interactivity.",
-            "blog": "A blog and portfolio starter with Markdown content stored in SQLite.",
-            "saas": "A SaaS starter with Stripe, SQLAlchemy models, and stubbed auth.",
-        }
-        return descriptions.get(self.template, "")
+        return _TEMPLATE_DESC.get(self.template, "")
 
     def get_deploy_config(self) -> Optional[Dict[str, str]]:
         """Get deployment adapter configuration."""
-        if "Docker (Dockerfile)" in self.adapters:
-            return {"adapter": "docker"}
-        if "Render (render.yaml)" in self.adapters:
-            return {"adapter": "render"}
+        for adapter, name in _ADAPTER_DEPLOY.items():
+            if adapter in self.adapters:
+                return {"adapter": name}
         return None
 
     def generate(self) -> None:
         """Generate the complete project structure."""
-        self.project_path.mkdir(parents=True, exist_ok=True)
-        self.app_root.mkdir(exist_ok=True)
-        self.pages_dir.mkdir(exist_ok=True)
-
-        # Generate base files
-        self._generate_pyproject()
-        self._generate_readme()
-        self._generate_gitignore()
-        self._generate_main()
-        self._generate_error_page()
-        self._generate_vscode_settings()
-
-        # Generate template-specific files
-        if self.template == "skeleton":
-            self._generate_skeleton()
-        if self.template == "counter":
-            self._generate_counter()
+        jobs = [
+            # Base files
+            *self._generate_pyproject(),
+            *self._generate_readme(),
+            *self._generate_gitignore(),
+            *self._generate_main(),
+            *self._generate_error_page(),
+            *self._generate_vscode_settings(),
+            # Template-specific files
+            *self._generate_template(),
+            # Deployment adapters
+            *self._generate_adapters(),
+        ]
+
+        # Create every directory up front so the writers below never race.
+        # Only the deepest directories are created explicitly; makedirs
+        # creates their parents along the way.
+        dirs = {self.project_path, self.app_root, self.pages_dir}
+        dirs.update(dest.parent for dest, _ in jobs)
         if self.template == "blog":
-            self._generate_blog()
-        if self.template == "saas":
-            self._generate_saas()
+            dirs.add(self.app_root / "data")
+        writers = [write for _, write in jobs]
+
+        # With a bundle, the static files come out of a single archive, which
+        # is built from the copy entries of the manifest
+        bundle = self.bundle
+        if bundle is not None:
+            manifest = MANIFESTS.get((self.template, self.routing_strategy), [])
+            dirs.update(
+                (self.app_root / dest_rel).parent
+                for kind, _, dest_rel in manifest
+                if kind == "copy"
+            )
+            app_root = self.app_root
+            writers.append(lambda: self.renderer.extract_bundle(bundle, app_root))
 
-        # Generate deployment adapters
-        self._generate_adapters()
+        ancestors = {parent for directory in dirs for parent in directory.parents}
+        for directory in dirs - ancestors:
+            os.makedirs(directory, exist_ok=True)
 
-    def _generate_skeleton(self) -> None:
-        """Generate Skeleton template files."""
-        context = {
-            "project_name": self.project_name,
-            "routing": self.routing_strategy,
-        }
-        content = self.renderer.render("skeleton/index.wire.j2", context)
-        (self.pages_dir / "index.wire").write_text(content)
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Files are independent of each other, so write them concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda write: write(), writers))
+
+    def _render_job(
+        self, template_path: str, context: Dict[str, Any], dest: Path
+    ) -> FileJob:
+        """Render a template now and create a job that writes it to dest.
+
+        Rendering happens on the calling thread against the preloaded
+        templates, so the worker threads only do file I/O.
+        """
+        content = self.renderer.render(template_path, context).encode()
+        return dest, lambda: write_file(dest, content)
+
+    def _copy_job(self, source_path: str, dest: Path) -> FileJob:
+        """Create a job that copies a static template file to dest."""
+        return dest, lambda: self.renderer.copy_static(source_path, dest)
 
-    def _generate_pyproject(self) -> None:
+    def _generate_pyproject(self) -> List[FileJob]:
         """Generate pyproject.toml."""
-        context = {
-            "project_name": self.project_name,
-            "dependencies": self.get_dependencies(),
-            "deploy_config": self.get_deploy_config(),
+        data: Dict[str, Any] = {
+            "project": {
+                "name": self.project_name,
+                "version": "0.1.0",
+                "description": "A new pywire application",
+                "requires-python": ">=3.12",
+                "dependencies": self.get_dependencies(),
+            }
         }
-        content = self.renderer.render("common/pyproject.toml.j2", context)
-        (self.project_path / "pyproject.toml").write_text(content)
-
-    def _generate_readme(self) -> None:
+        deploy_config = self.get_deploy_config()
+        if deploy_config:
+            data["tool"] = {
+                "pywire": {
+                    "deploy": {
+                        "adapter": deploy_config["adapter"],
+                        "docker": {"port": 8000, "workers": 4},
+                        "render": {"region": "oregon"},
+                    }
+                }
+            }
+
+        import tomli_w
+
+        dest = self.project_path / "pyproject.toml"
+        content = tomli_w.dumps(data).encode()
+        return [(dest, lambda: write_file(dest, content))]
+
+    def _generate_readme(self) -> List[FileJob]:
         """Generate README.md."""
         routing_label = "Path-based" if self.routing_strategy == "path" else "Explicit"
         context = {
@@ -217,198 +628,72 @@ class ProjectGenerator:
             "template_description": self.get_template_description(),
             "routing_style": routing_label,
         }
-        content = self.renderer.render("common/README.md.j2", context)
-        (self.project_path / "README.md").write_text(content)
+        return [
+            self._render_job(
+                "common/README.md.j2", context, self.project_path / "README.md"
+            )
+        ]
 
-    def _generate_gitignore(self) -> None:
+    def _generate_gitignore(self) -> List[FileJob]:
         """Generate .gitignore."""
-        self.renderer.copy_static("common/.gitignore", self.project_path / ".gitignore")
+        return [self._copy_job("common/.gitignore", self.project_path / ".gitignore")]
 
-    def _generate_vscode_settings(self) -> None:
+    def _generate_vscode_settings(self) -> List[FileJob]:
         """Generate VS Code settings."""
-        vscode_dir = self.project_path / ".vscode"
-        vscode_dir.mkdir(exist_ok=True)
-        self.renderer.copy_static(
-            "common/extensions.json", vscode_dir / "extensions.json"
-        )
+        dest = self.project_path / ".vscode/extensions.json"
+        return [self._copy_job("common/extensions.json", dest)]
 
-    def _generate_main(self) -> None:
+    def _generate_main(self) -> List[FileJob]:
         """Generate main.py."""
-        template_name = (
-            "main-path.py.j2"
-            if self.routing_strategy == "path"
-            else "main-explicit.py.j2"
-        )
         context = {
             "pages_dir": "src/pages" if self.use_src else "pages",
         }
-        content = self.renderer.render(f"common/{template_name}", context)
-        (self.app_root / "main.py").write_text(content)
-
-    def _generate_error_page(self) -> None:
-        """Generate __error__.wire."""
-        self.renderer.copy_static(
-            "common/__error__.wire", self.pages_dir / "__error__.wire"
-        )
-
-    def _generate_counter(self) -> None:
-        """Generate Counter template files."""
-        context = {"project_name": self.project_name}
-        routing = self.routing_strategy
-
-        if routing == "path":
-            layout_content = self.renderer.render(
-                "counter/path-based/__layout__.wire.j2", context
-            )
-            (self.pages_dir / "__layout__.wire").write_text(layout_content)
-            self.renderer.copy_static(
-                "counter/path-based/index.wire", self.pages_dir / "index.wire"
-            )
-        else:
-            layout_content = self.renderer.render(
-                "counter/explicit/layout.wire.j2", context
-            )
-            (self.pages_dir / "layout.wire").write_text(layout_content)
-            self.renderer.copy_static(
-                "counter/explicit/home.wire", self.pages_dir / "home.wire"
-            )
-
-    def _generate_blog(self) -> None:
-        """Generate Blog template files."""
-        context = {"project_name": self.project_name}
-        routing = self.routing_strategy
-
-        # Create data directory
-        (self.app_root / "data").mkdir(exist_ok=True)
-
-        if routing == "path":
-            # Create posts subdirectory
-            (self.pages_dir / "posts").mkdir(exist_ok=True)
-
-            # Layouts
-            layout_content = self.renderer.render(
-                "blog/path-based/__layout__.wire.j2", context
-            )
-            (self.pages_dir / "__layout__.wire").write_text(layout_content)
-
-            posts_layout_content = self.renderer.render(
-                "blog/path-based/posts__layout__.wire.j2", context
-            )
-            (self.pages_dir / "posts" / "__layout__.wire").write_text(
-                posts_layout_content
-            )
-
-            # Pages
-            self.renderer.copy_static(
-                "blog/path-based/index.wire", self.pages_dir / "index.wire"
-            )
-            self.renderer.copy_static(
-                "blog/path-based/posts_index.wire",
-                self.pages_dir / "posts" / "index.wire",
-            )
-            self.renderer.copy_static(
-                "blog/path-based/posts_slug.wire",
-                self.pages_dir / "posts" / "[slug].wire",
-            )
-        else:
-            # Layout
-            layout_content = self.renderer.render(
-                "blog/explicit/layout.wire.j2", context
-            )
-            (self.pages_dir / "layout.wire").write_text(layout_content)
-
-            # Pages
-            self.renderer.copy_static(
-                "blog/explicit/home.wire", self.pages_dir / "home.wire"
+        return [
+            self._render_job(
+                self.get_main_template(), context, self.app_root / "main.py"
             )
-            self.renderer.copy_static(
-                "blog/explicit/blog-posts.wire", self.pages_dir / "blog-posts.wire"
-            )
-            self.renderer.copy_static(
-                "blog/explicit/about.wire", self.pages_dir / "about.wire"
-            )
-
-    def _generate_saas(self) -> None:
-        """Generate SaaS template files."""
-        context = {"project_name": self.project_name}
-        routing = self.routing_strategy
-
-        # Copy models.py
-        self.renderer.copy_static("saas/models.py", self.app_root / "models.py")
-
-        if routing == "path":
-            # Create dashboard subdirectory
-            (self.pages_dir / "dashboard").mkdir(exist_ok=True)
-
-            # Layouts
-            layout_content = self.renderer.render(
-                "saas/path-based/__layout__.wire.j2", context
-            )
-            (self.pages_dir / "__layout__.wire").write_text(layout_content)
+        ]
 
-            dashboard_layout_content = self.renderer.render(
-                "saas/path-based/dashboard__layout__.wire.j2", context
-            )
-            (self.pages_dir / "dashboard" / "__layout__.wire").write_text(
-                dashboard_layout_content
-            )
-
-            # Pages
-            self.renderer.copy_static(
-                "saas/path-based/index.wire", self.pages_dir / "index.wire"
-            )
-            self.renderer.copy_static(
-                "saas/path-based/pricing.wire", self.pages_dir / "pricing.wire"
-            )
-            self.renderer.copy_static(
-                "saas/path-based/login.wire", self.pages_dir / "login.wire"
-            )
-            self.renderer.copy_static(
-                "saas/path-based/dashboard_index.wire",
-                self.pages_dir / "dashboard" / "index.wire",
-            )
-            self.renderer.copy_static(
-                "saas/path-based/dashboard_settings.wire",
-                self.pages_dir / "dashboard" / "settings.wire",
-            )
-        else:
-            # Layouts
-            public_layout_content = self.renderer.render(
-                "saas/explicit/public-layout.wire.j2", context
-            )
-            (self.pages_dir / "public-layout.wire").write_text(public_layout_content)
-
-            auth_layout_content = self.renderer.render(
-                "saas/explicit/auth-layout.wire.j2", context
-            )
-            (self.pages_dir / "auth-layout.wire").write_text(auth_layout_content)
+    def _generate_error_page(self) -> List[FileJob]:
+        """Generate __error__.wire."""
+        return [
+            self._copy_job("common/__error__.wire", self.pages_dir / "__error__.wire")
+        ]
 
-            # Pages
-            self.renderer.copy_static(
-                "saas/explicit/landing.wire", self.pages_dir / "landing.wire"
-            )
-            self.renderer.copy_static(
-                "saas/explicit/pricing.wire", self.pages_dir / "pricing.wire"
-            )
-            self.renderer.copy_static(
-                "saas/explicit/login.wire", self.pages_dir / "login.wire"
-            )
-            self.renderer.copy_static(
-                "saas/explicit/dashboard-pages.wire",
-                self.pages_dir / "dashboard-pages.wire",
-            )
+    def _generate_template(self) -> List[FileJob]:
+        """Generate the files for the selected template and routing strategy."""
+        context = {
+            "project_name": self.project_name,
+            "routing": self.routing_strategy,
+        }
 
-    def _generate_adapters(self) -> None:
+        jobs: List[FileJob] = []
+        manifest = MANIFESTS.get((self.template, self.routing_strategy), [])
+        for kind, source, dest_rel in manifest:
+            dest = self.app_root / dest_rel
+            if kind == "render":
+                jobs.append(self._render_job(source, context, dest))
+            elif self.bundle is None:
+                # Otherwise generate() extracts the static files from the bundle
+                jobs.append(self._copy_job(source, dest))
+        return jobs
+
+    def _generate_adapters(self) -> List[FileJob]:
         """Generate deployment adapter files."""
+        jobs: List[FileJob] = []
         if "Docker (Dockerfile)" in self.adapters:
-            self.renderer.copy_static(
-                "common/Dockerfile", self.project_path / "Dockerfile"
+            jobs.append(
+                self._copy_job("common/Dockerfile", self.project_path / "Dockerfile")
             )
 
         if "Render (render.yaml)" in self.adapters:
             context = {"project_name": self.project_name}
-            content = self.renderer.render("common/render.yaml.j2", context)
-            (self.project_path / "render.yaml").write_text(content)
+            jobs.append(
+                self._render_job(
+                    "common/render.yaml.j2", context, self.project_path / "render.yaml"
+                )
+            )
+        return jobs
 
 
 def main():
@@ -425,15 +710,61 @@ def main():
 
         asyncio.set_event_loop_policy(MacOSEventLoopPolicy())
 
-    console.clear()
-
-    # Parse arguments
+    # Parse arguments before importing anything heavy, so `--help` and
+    # `--version` return immediately
     parser = argparse.ArgumentParser(description="Create a new PyWire application")
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {get_version()}"
+    )
     parser.add_argument(
         "--pywire-version", help="Specify a specific version of pywire to install"
     )
+    # Project options; any left unset are asked for interactively
+    parser.add_argument("--path", help="Directory to create the project in")
+    parser.add_argument(
+        "--template", choices=list(_TEMPLATE_DESC), help="Starting template"
+    )
+    parser.add_argument(
+        "--routing", choices=["path", "explicit"], help="Routing architecture"
+    )
+    parser.add_argument(
+        "--src",
+        action=argparse.BooleanOptionalAction,
+        help="Use the 'src/' directory layout",
+    )
+    adapter_group = parser.add_mutually_exclusive_group()
+    adapter_group.add_argument(
+        "--adapter",
+        dest="adapters",
+        action="append",
+        choices=list(_ADAPTER_DEPLOY.values()),
+        help="Deployment adapter to configure (repeatable)",
+    )
+    adapter_group.add_argument(
+        "--no-adapters",
+        dest="adapters",
+        action="store_const",
+        const=[],
+        help="Configure no deployment adapters",
+    )
     args = parser.parse_args()
 
+    # Only pay for questionary (and prompt_toolkit) when something is left
+    # to ask; fully specified runs skip every prompt, including the final one
+    interactive = any(
+        value is None
+        for value in (args.path, args.template, args.routing, args.src, args.adapters)
+    )
+    if interactive:
+        import questionary
+
+    console = _get_console()
+
+    # Only wipe the screen for interactive sessions; in CI or when piped it
+    # is a wasted flush that also discards useful scrollback
+    if sys.stdout.isatty() and not os.environ.get("CI"):
+        console.clear()
+
     # Check for local override for testing (highest priority)
     use_local = os.environ.get("USE_LOCAL_PYWIRE") == "1"
 
@@ -454,10 +785,8 @@ def main():
 
         if local_pywire_version_file.exists():
             # Basic regex search for version string to avoid importing it
-            import re
-
             content = local_pywire_version_file.read_text()
-            match = re.search(r'version = ["\']([^"\']+)["\']', content)
+            match = _VERSION_ASSIGN_RE.search(content)
             if match:
                 pywire_version_display = f"{match.group(1)} (Local)"
 
@@ -474,88 +803,132 @@ def main():
         pywire_dep = "pywire"  # Latest
         pywire_version_display = "Latest"
 
-    # Resolve the actual version if not local
-    if not use_local and pywire_version_display == "Latest":
-        with console.status("[dim]Resolving version...", spinner="dots"):
-            resolved_version = resolve_pywire_version(pywire_dep)
-            if resolved_version:
-                pywire_version_display = resolved_version
+    # Resolve the actual version in the background while the user answers
+    # the prompts; the result is only needed once the prompts are done.
+    # Pinned and local versions are already known. Fully specified runs have
+    # no prompts to hide the latency behind, and CI and piped runs shouldn't
+    # wait on the network for a display string, so both skip the lookup.
+    version_executor: Optional["ThreadPoolExecutor"] = None
+    version_future: Optional["Future[Optional[str]]"] = None
+    if (
+        interactive
+        and not use_local
+        and pywire_version_display == "Latest"
+        and sys.stdout.isatty()
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+
+        version_executor = ThreadPoolExecutor(max_workers=1)
+        version_future = version_executor.submit(resolve_pywire_version, pywire_dep)
 
     tool_version = get_version()
 
-    console.print(LOGO)
-    console.print(f"[dim]v{tool_version} • PyWire {pywire_version_display}[/dim]\n")
+    console.print(_get_logo(), highlight=False)
 
     if use_local:
         console.print("[yellow]WARNING: Using local pywire dependency[/yellow]")
 
     try:
         # Project Location
-        project_location = questionary.path(
-            "Where should we initialize the system?",
-            default="./my-pywire-app",
-            style=questionary.Style(
-                [
-                    ("qmark", "fg:#00ffff bold"),
-                    ("question", "bold"),
-                    ("answer", "fg:#00ffff"),
-                ]
-            ),
-        ).unsafe_ask()
+        project_location = args.path
+        if project_location is None:
+            project_location = questionary.path(
+                "Where should we initialize the system?",
+                default="./my-pywire-app",
+                style=questionary.Style(
+                    [
+                        ("qmark", "fg:#00ffff bold"),
+                        ("question", "bold"),
+                        ("answer", "fg:#00ffff"),
+                    ]
+                ),
+            ).unsafe_ask()
 
-        project_path = Path(project_location).expanduser().resolve()
+        # Absolute, normalized path without resolve()'s per-segment lstat
+        # calls; symlinks don't matter for creating a new directory
+        project_path = Path(
+            os.path.normpath(
+                os.path.join(os.getcwd(), os.path.expanduser(project_location))
+            )
+        )
         project_name = project_path.name
 
         # Project Template
-        template = questionary.select(
-            "Select a starting template:",
-            choices=[
-                questionary.Choice("Skeleton (minimal)", value="skeleton"),
-                questionary.Choice("Counter", value="counter"),
-                questionary.Choice("Blog/Portfolio (Markdown + SQLite)", value="blog"),
-                questionary.Choice(
-                    "SaaS Starter (Stripe + SQLAlchemy + Auth Stub)", value="saas"
-                ),
-            ],
-            default="counter",
-            pointer=">",
-        ).unsafe_ask()
+        template = args.template
+        if template is None:
+            template = questionary.select(
+                "Select a starting template:",
+                choices=[
+                    questionary.Choice("Skeleton (minimal)", value="skeleton"),
+                    questionary.Choice("Counter", value="counter"),
+                    questionary.Choice(
+                        "Blog/Portfolio (Markdown + SQLite)", value="blog"
+                    ),
+                    questionary.Choice(
+                        "SaaS Starter (Stripe + SQLAlchemy + Auth Stub)", value="saas"
+                    ),
+                ],
+                default="counter",
+                pointer=">",
+            ).unsafe_ask()
 
         # Routing Strategy
-        routing_strategy = questionary.select(
-            "Choose a routing architecture:",
-            choices=[
-                questionary.Choice(
-                    "Path-based", value="path", checked=True, shortcut_key="p"
-                ),
-                questionary.Choice("Explicit", value="explicit", shortcut_key="e"),
-            ],
-            qmark="?",
-            pointer=">",
-        ).unsafe_ask()
+        routing_strategy = args.routing
+        if routing_strategy is None:
+            routing_strategy = questionary.select(
+                "Choose a routing architecture:",
+                choices=[
+                    questionary.Choice(
+                        "Path-based", value="path", checked=True, shortcut_key="p"
+                    ),
+                    questionary.Choice("Explicit", value="explicit", shortcut_key="e"),
+                ],
+                qmark="?",
+                pointer=">",
+            ).unsafe_ask()
 
         # Project Structure
-        use_src = questionary.confirm(
-            "Use 'src/' directory layout?",
-            default=True,
-            auto_enter=False,
-            instruction=" (Y/n) Recommended for larger projects ",
-        ).unsafe_ask()
+        use_src = args.src
+        if use_src is None:
+            use_src = questionary.confirm(
+                "Use 'src/' directory layout?",
+                default=True,
+                auto_enter=False,
+                instruction=" (Y/n) Recommended for larger projects ",
+            ).unsafe_ask()
 
         # Deployment Adapters
-        adapters = questionary.checkbox(
-            "Select deployment adapters to configure:",
-            choices=["Docker (Dockerfile)", "Render (render.yaml)"],
-        ).unsafe_ask()
+        if args.adapters is None:
+            adapters = questionary.checkbox(
+                "Select deployment adapters to configure:",
+                choices=list(_ADAPTER_DEPLOY),
+            ).unsafe_ask()
+        else:
+            adapters = [
+                adapter
+                for adapter, name in _ADAPTER_DEPLOY.items()
+                if name in args.adapters
+            ]
+
+        if version_future is not None:
+            try:
+                resolved_version = version_future.result(timeout=0.1)
+            except TimeoutError:
+                # Still running; don't hold up generation for a display string.
+                # (concurrent.futures.TimeoutError is this builtin since 3.11,
+                # and resolve_pywire_version handles its own errors.)
+                resolved_version = None
+            if resolved_version:
+                pywire_version_display = resolved_version
+
+        console.print(f"\n[dim]v{tool_version} • PyWire {pywire_version_display}[/dim]")
 
         # Generate project
         console.print()
 
-        with console.status(
+        with _status(
             "[bold cyan]Synthesizing project structure...", spinner="simpleDots"
         ):
-            time.sleep(1.0)
-
             generator = ProjectGenerator(
                 project_path=project_path,
                 project_name=project_name,
@@ -567,85 +940,86 @@ def main():
             )
             generator.generate()
 
-            # Initialize git repo
-            git_initialized = False
-            try:
-                subprocess.run(
-                    ["git", "init"],
-                    cwd=project_path,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-                git_initialized = True
-            except (FileNotFoundError, subprocess.CalledProcessError):
-                pass  # Silently skip if git is not available
-            if git_initialized:
+            # Initialize git repo (silently skipped if git is not available)
+            if shutil.which("git"):
                 try:
-                    subprocess.run(
-                        ["git", "add", "."],
-                        cwd=project_path,
-                        check=True,
-                        capture_output=True,
-                        text=True,
-                    )
-                    subprocess.run(
-                        ["git", "commit", "-m", "feat: initial project structure"],
-                        cwd=project_path,
-                        check=True,
-                        capture_output=True,
-                        text=True,
-                    )
+                    for command in git_init_commands():
+                        subprocess.run(
+                            command,
+                            cwd=project_path,
+                            check=True,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE,
+                        )
                 except subprocess.CalledProcessError as e:
-                    console.print(
-                        "[yellow]![/yellow] Git commit skipped (configure user.name/email to enable)."
-                    )
+                    # init, add and commit may run as one command, so tell
+                    # them apart by whether the repository exists
+                    if (project_path / ".git").is_dir():
+                        console.print(
+                            "[yellow]![/yellow] Git repository created, but the initial "
+                            "commit was skipped (set `git config user.name` and "
+                            "`git config user.email` to enable)."
+                        )
+                    else:
+                        console.print(
+                            "[yellow]![/yellow] Git initialization failed, continuing "
+                            "without a repository."
+                        )
                     if e.stderr:
-                        console.print(e.stderr)
+                        console.print(e.stderr.decode("utf-8", "replace"))
                 except FileNotFoundError:
-                    console.print("[yellow]![/yellow] Git not found, skipping commit")
+                    pass
 
             console.print("[green]✓[/green] Project structure created")
 
         # UV SYNC
         sync_success = False
-        with console.status(
+        with _status(
             "[bold cyan]Initializing environment (uv sync)...", spinner="bouncingBar"
         ):
             try:
                 env = os.environ.copy()
                 env.pop("VIRTUAL_ENV", None)
+                # No progress bars since output is captured, and compile
+                # bytecode up front so the first `pywire dev` starts faster
+                env["UV_NO_PROGRESS"] = "1"
+                env["UV_COMPILE_BYTECODE"] = "1"
 
                 subprocess.run(
-                    ["uv", "sync"],
+                    [find_uv_bin(), "sync"],
                     cwd=project_path,
                     check=True,
-                    capture_output=True,
-                    text=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     env=env,
                 )
                 console.print("[green]✓[/green] Environment optimized")
                 sync_success = True
             except subprocess.CalledProcessError as e:
                 console.print("[red]✗[/red] Failed to sync environment")
-                console.print(e.stderr)
+                console.print(e.stderr.decode("utf-8", "replace"))
             except FileNotFoundError:
                 console.print("[yellow]![/yellow] uv not found, skipping sync")
 
-        next_action = questionary.select(
-            "What would you like to do next?",
-            choices=[
-                questionary.Choice("Start development server", value="start"),
-                questionary.Choice("Show instructions and exit", value="instructions"),
-            ],
-            pointer=">",
-        ).unsafe_ask()
+        if interactive:
+            next_action = questionary.select(
+                "What would you like to do next?",
+                choices=[
+                    questionary.Choice("Start development server", value="start"),
+                    questionary.Choice(
+                        "Show instructions and exit", value="instructions"
+                    ),
+                ],
+                pointer=">",
+            ).unsafe_ask()
+        else:
+            next_action = "instructions"
 
         should_show_instructions = next_action == "instructions"
         if next_action == "start":
             try:
                 subprocess.run(
-                    ["uv", "run", "pywire", "dev"],
+                    [find_uv_bin(), "run", "pywire", "dev"],
                     cwd=project_path,
                     check=True,
                 )
@@ -658,6 +1032,9 @@ def main():
                 should_show_instructions = True
 
         if should_show_instructions:
+            from rich.markdown import Markdown
+            from rich.panel import Panel
+
             console.print()
 
             is_windows = os.name == "nt"
@@ -698,6 +1075,9 @@ Run the following commands to enter the environment:
     except KeyboardInterrupt:
         console.print("\n[bold red]System Aborted.[/bold red]")
         sys.exit(1)
+    finally:
+        if version_executor is not None:
+            version_executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":
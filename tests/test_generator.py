@@ -0,0 +1,192 @@
+import os
+import subprocess
+import sys
+import tarfile
+import types
+
+import pytest
+
+from create_pywire_app.main import (
+    MANIFESTS,
+    TEMPLATE_ROOT,
+    ProjectGenerator,
+    TemplateRenderer,
+    _build_env,
+    _get_compiled_templates,
+    _get_simple_template,
+    _get_template,
+)
+
+
+@pytest.mark.parametrize("template,routing", sorted(MANIFESTS))
+def test_generate_writes_manifest_files(tmp_path, template, routing):
+    project_path = tmp_path / "my-app"
+    generator = ProjectGenerator(
+        project_path=project_path,
+        project_name="my-app",
+        template=template,
+        routing_strategy=routing,
+        use_src=True,
+        adapters=["Docker (Dockerfile)", "Render (render.yaml)"],
+        pywire_dep="pywire",
+    )
+    generator.generate()
+
+    for name in [
+        "pyproject.toml",
+        "README.md",
+        ".gitignore",
+        ".vscode/extensions.json",
+        "Dockerfile",
+        "render.yaml",
+        "src/main.py",
+        "src/pages/__error__.wire",
+    ]:
+        assert (project_path / name).is_file(), name
+
+    for _, _, dest_rel in MANIFESTS[(template, routing)]:
+        assert (project_path / "src" / dest_rel).is_file(), dest_rel
+
+    assert 'name = "my-app"' in (project_path / "pyproject.toml").read_text()
+
+
+@pytest.mark.parametrize("template,routing", sorted(MANIFESTS))
+def test_template_paths_exist(tmp_path, template, routing):
+    generator = ProjectGenerator(
+        project_path=tmp_path / "my-app",
+        project_name="my-app",
+        template=template,
+        routing_strategy=routing,
+        use_src=False,
+        adapters=["Render (render.yaml)"],
+        pywire_dep="pywire",
+    )
+
+    for template_path in generator.get_template_paths():
+        assert (TEMPLATE_ROOT / template_path).is_file(), template_path
+
+
+@pytest.mark.parametrize(
+    "template_path",
+    sorted(
+        p.relative_to(TEMPLATE_ROOT).as_posix() for p in TEMPLATE_ROOT.rglob("*.j2")
+    ),
+)
+def test_simple_templates_match_jinja(template_path):
+    simple = _get_simple_template(template_path)
+    if simple is None:
+        pytest.skip("rendered with Jinja2")
+
+    context = {
+        "project_name": "my-app",
+        "template_description": "A {braced} description",
+        "routing_style": "Explicit",
+        "pages_dir": "pages",
+    }
+    expected = _get_template(template_path).render(**context)
+    assert TemplateRenderer().render(template_path, context) == expected
+
+
+def test_generate_without_jinja_templates_skips_jinja(tmp_path):
+    code = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from create_pywire_app.main import ProjectGenerator\n"
+        "ProjectGenerator(\n"
+        f"    project_path=Path({str(tmp_path / 'my-app')!r}),\n"
+        "    project_name='my-app',\n"
+        "    template='counter',\n"
+        "    routing_strategy='path',\n"
+        "    use_src=True,\n"
+        "    adapters=[],\n"
+        "    pywire_dep='pywire',\n"
+        ").generate()\n"
+        "assert 'jinja2' not in sys.modules\n"
+    )
+    env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path / "cache")}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+    assert not (tmp_path / "cache").exists()
+
+
+@pytest.mark.parametrize("use_src", [True, False])
+def test_generate_from_bundle_matches_copies(tmp_path, monkeypatch, use_src):
+    template, routing = "blog", "explicit"
+    bundle = tmp_path / f"{template}-{routing}.tar"
+    static = [
+        (src, dest)
+        for kind, src, dest in MANIFESTS[(template, routing)]
+        if kind == "copy"
+    ]
+    # Same layout as the build hook's bundles: static files at their app_root paths
+    with tarfile.open(bundle, "w") as archive:
+        for src, dest in static:
+            archive.add(TEMPLATE_ROOT / src, arcname=dest)
+
+    def generate(name, bundle_path):
+        monkeypatch.setattr(TemplateRenderer, "get_bundle", lambda self, _: bundle_path)
+        project_path = tmp_path / name / "my-app"
+        ProjectGenerator(
+            project_path=project_path,
+            project_name="my-app",
+            template=template,
+            routing_strategy=routing,
+            use_src=use_src,
+            adapters=[],
+            pywire_dep="pywire",
+        ).generate()
+        return project_path
+
+    copied = generate("copied", None)
+    bundled = generate("bundled", bundle)
+
+    def tree(root):
+        return {
+            path.relative_to(root): path.read_bytes() if path.is_file() else None
+            for path in root.rglob("*")
+        }
+
+    assert tree(bundled) == tree(copied)
+    # Nothing is created outside the project
+    assert sorted(p.name for p in (tmp_path / "bundled").iterdir()) == ["my-app"]
+
+
+@pytest.fixture
+def compiled_templates(monkeypatch):
+    """Install a precompiled templates module like the one the build hook ships."""
+    import jinja2
+
+    def install(template_paths, jinja_version=jinja2.__version__):
+        env = _build_env()
+        module = types.ModuleType("create_pywire_app._templates_compiled")
+        module.JINJA_VERSION = jinja_version
+        module.TEMPLATES = {
+            path: env.compile(
+                (TEMPLATE_ROOT / path).read_text(encoding="utf-8"),
+                path,
+                path,
+                raw=True,
+            )
+            for path in template_paths
+        }
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        _get_compiled_templates.cache_clear()
+        _get_template.cache_clear()
+
+    yield install
+    _get_compiled_templates.cache_clear()
+    _get_template.cache_clear()
+
+
+def test_compiled_templates_render_like_loaded_ones(compiled_templates):
+    template_path = "skeleton/index.wire.j2"
+    compiled_templates([template_path])
+    context = {"project_name": "my-app", "routing": "explicit"}
+
+    assert template_path in _get_compiled_templates()
+    expected = _build_env().get_template(template_path).render(**context)
+    assert _get_template(template_path).render(**context) == expected
+
+
+def test_compiled_templates_ignored_for_other_jinja(compiled_templates):
+    compiled_templates(["skeleton/index.wire.j2"], jinja_version="0.0.0")
+    assert _get_compiled_templates() == {}
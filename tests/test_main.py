@@ -0,0 +1,184 @@
+import http.client
+import os
+import subprocess
+import sys
+import types
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from create_pywire_app import main as cli
+from create_pywire_app.main import (
+    _make_bytecode_cache,
+    get_local_version,
+    resolve_pywire_version,
+)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        http.client.RemoteDisconnected("Remote end closed connection"),
+        http.client.IncompleteRead(b""),
+        ConnectionResetError(),
+    ],
+)
+def test_resolve_pywire_version_ignores_network_errors(monkeypatch, error):
+    def urlopen(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(urllib.request, "urlopen", urlopen)
+    assert resolve_pywire_version("pywire") is None
+
+
+def test_resolve_pywire_version_skips_lookup_for_pins_and_paths():
+    assert resolve_pywire_version("pywire==0.1.4") == "0.1.4"
+    assert resolve_pywire_version("pywire @ /path/to/pywire") is None
+
+
+def test_bytecode_cache_skipped_for_unwritable_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "create-pywire-app" / "jinja"
+    cache_dir.mkdir(parents=True)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(os, "access", lambda path, mode: False)
+    assert _make_bytecode_cache() is None
+
+
+def test_bytecode_cache_skipped_without_home(monkeypatch):
+    def home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", home)
+    assert _make_bytecode_cache() is None
+
+
+@pytest.fixture
+def run_main(tmp_path, monkeypatch):
+    """Run main() in tmp_path with the given CLI args, recording subprocesses."""
+    calls = []
+
+    def run(command, **kwargs):
+        calls.append(command)
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cli.subprocess, "run", run)
+
+    def invoke(*args):
+        monkeypatch.setattr(sys, "argv", ["create-pywire-app", *args])
+        cli.main()
+        return calls
+
+    return invoke
+
+
+FULL_ARGS = ("--path", "app", "--template", "counter", "--routing", "path", "--src")
+
+
+def test_main_fully_specified_never_prompts(run_main, tmp_path, monkeypatch):
+    # Importing questionary at all would fail the run
+    monkeypatch.setitem(sys.modules, "questionary", None)
+
+    calls = run_main(*FULL_ARGS, "--adapter", "render")
+
+    project = tmp_path / "app"
+    assert (project / "src" / "main.py").is_file()
+    assert (project / "render.yaml").is_file()
+    assert not (project / "Dockerfile").exists()
+    assert 'adapter = "render"' in (project / "pyproject.toml").read_text()
+    # Straight to the instructions, never the dev server
+    assert not any("dev" in command for command in calls)
+
+
+def test_main_no_adapters(run_main, tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "questionary", None)
+
+    run_main(*FULL_ARGS, "--no-adapters")
+
+    project = tmp_path / "app"
+    assert not (project / "render.yaml").exists()
+    assert not (project / "Dockerfile").exists()
+    assert "deploy" not in (project / "pyproject.toml").read_text()
+
+
+def test_main_adapter_flags_are_exclusive(run_main):
+    with pytest.raises(SystemExit):
+        run_main(*FULL_ARGS, "--adapter", "docker", "--no-adapters")
+
+
+def test_main_prompts_for_unset_options(run_main, tmp_path, monkeypatch):
+    asked = []
+
+    def prompt(answer):
+        def ask(message, **kwargs):
+            asked.append(message)
+            return types.SimpleNamespace(unsafe_ask=lambda: answer)
+
+        return ask
+
+    questionary = types.SimpleNamespace(
+        path=prompt("app"),
+        select=prompt("instructions"),
+        Choice=lambda *args, **kwargs: None,
+        Style=lambda *args, **kwargs: None,
+    )
+    monkeypatch.setitem(sys.modules, "questionary", questionary)
+
+    run_main(*FULL_ARGS[2:], "--adapter", "docker", "--adapter", "render")
+
+    assert asked == [
+        "Where should we initialize the system?",
+        "What would you like to do next?",
+    ]
+    project = tmp_path / "app"
+    assert (project / "Dockerfile").is_file()
+    assert 'adapter = "docker"' in (project / "pyproject.toml").read_text()
+
+
+@pytest.mark.parametrize(
+    "init_succeeded,message",
+    [(True, "Git repository created"), (False, "Git initialization failed")],
+)
+def test_main_reports_git_failures(
+    run_main, monkeypatch, capsys, init_succeeded, message
+):
+    monkeypatch.setitem(sys.modules, "questionary", None)
+
+    def run(command, cwd=None, **kwargs):
+        if "git" in " ".join(command):
+            if init_succeeded:
+                (Path(cwd) / ".git").mkdir(exist_ok=True)
+            raise subprocess.CalledProcessError(
+                128, command, stderr=b"Please tell me who you are."
+            )
+        return subprocess.CompletedProcess(command, 0)
+
+    monkeypatch.setattr(cli.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(cli.subprocess, "run", run)
+    run_main(*FULL_ARGS, "--no-adapters")
+
+    out = capsys.readouterr().out
+    assert message in out
+    assert ("user.email" in out) == init_succeeded
+    assert "Please tell me who you are." in out
+
+
+@pytest.mark.parametrize(
+    "pyproject",
+    [
+        # Matched by the [project] regex
+        '[project]\nname = "app"\nversion = "1.2.3"\n',
+        # An array before the version defeats the regex; tomllib handles it
+        '[project]\nname = "app"\nauthors = [{name = "a"}]\nversion = "1.2.3"\n',
+    ],
+)
+def test_get_local_version(tmp_path, pyproject):
+    path = tmp_path / "pyproject.toml"
+    path.write_text(pyproject)
+    assert get_local_version(path) == "1.2.3"
+
+
+def test_get_local_version_missing_file(tmp_path):
+    assert get_local_version(tmp_path / "pyproject.toml") is None
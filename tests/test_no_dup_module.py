@@ -0,0 +1,7 @@
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).parent.parent / "src" / "create_pywire_app"
+
+
+def test_single_main_module():
+    assert len(list(PACKAGE_DIR.glob("main*.py"))) == 1